@@ -4,6 +4,8 @@
 
 #include <pybind11/stl.h>
 
+#include <pybind11/numpy.h>
+
 #include "rlwe_sa/cc/shell_encryption_api.h"  // Include the header file where your class is defined
 
 #include "rlwe_sa/cc/shell_encryption/montgomery.h"
@@ -58,6 +60,21 @@ namespace rlwe_sa {
     return result;
   }
 
+  // Convert key coefficients to a uint64 NumPy array without creating Python ints
+  py::array_t < uint64_t > KeyVectorToArray(const std::vector < absl::uint128 > & key_vector) {
+    // The key coefficients are residues modulo the 14-bit modulus p, so they fit in 64 bits
+    auto * coeffs = new std::vector < uint64_t > ();
+    coeffs->reserve(key_vector.size());
+    for (const absl::uint128 & val: key_vector) {
+      coeffs->push_back(absl::Uint128Low64(val));
+    }
+    // The capsule owns the vector, so the array is a zero-copy view over it
+    py::capsule owner(coeffs, [](void * ptr) {
+      delete reinterpret_cast < std::vector < uint64_t > * > (ptr);
+    });
+    return py::array_t < uint64_t > (coeffs->size(), coeffs->data(), owner);
+  }
+
   PYBIND11_MODULE(_shell_encryption, m) {
     // Bind the class
     m.def("uint128_to_pyint", & Uint128ToPyInt, "Convert absl::uint128 to Python int");
@@ -71,6 +88,7 @@ namespace rlwe_sa {
         return py::bytes(seed); // Return the data as py::bytes without transcoding
       })
       .def("sample_key", & RlweSecAgg < ModularInt > ::SampleKey) // Member function
+      .def("sample_keys", & RlweSecAgg < ModularInt > ::SampleKeys) // Member function
       .def("create_key", [](RlweSecAgg < ModularInt > & self,
         const py::list & key_vector) {
         std::vector < absl::uint128 > converted_key;
@@ -78,6 +96,15 @@ namespace rlwe_sa {
           converted_key.push_back(convert_python_int_to_uint128(py::reinterpret_borrow < py::object > (value)));
         }
         return self.CreateKey(converted_key);
+      })
+      .def("create_key", [](RlweSecAgg < ModularInt > & self,
+        const py::array_t < uint64_t, py::array::c_style > & key_vector) {
+        auto view = key_vector.unchecked < 1 > ();
+        std::vector < absl::uint128 > converted_key(view.shape(0));
+        for (py::ssize_t i = 0; i < view.shape(0); i++) {
+          converted_key[i] = view(i);
+        }
+        return self.CreateKey(converted_key);
       }).def("encrypt", [](RlweSecAgg < rlwe::MontgomeryInt < absl::uint128 >> & self,
         const rlwe::SymmetricRlweKey < rlwe::MontgomeryInt < absl::uint128 >> & key,
           const py::list & plaintext) {
@@ -88,6 +115,16 @@ namespace rlwe_sa {
         }
         return self.Encrypt(key, converted_plaintext);
       })
+      .def("encrypt", [](RlweSecAgg < ModularInt > & self,
+        const rlwe::SymmetricRlweKey < ModularInt > & key,
+          const py::array_t < uint64_t, py::array::c_style > & plaintext) {
+        auto view = plaintext.unchecked < 1 > ();
+        std::vector < absl::uint128 > converted_plaintext(view.shape(0));
+        for (py::ssize_t i = 0; i < view.shape(0); i++) {
+          converted_plaintext[i] = view(i);
+        }
+        return self.Encrypt(key, converted_plaintext);
+      })
       .def("decrypt", [](RlweSecAgg < rlwe::MontgomeryInt < absl::uint128 >> & self,
         const rlwe::SymmetricRlweKey < rlwe::MontgomeryInt < absl::uint128 >> & key,
           const std::vector < rlwe::SymmetricRlweCiphertext < rlwe::MontgomeryInt < absl::uint128 >>> & ciphertexts) {
@@ -103,6 +140,7 @@ namespace rlwe_sa {
         return py_result; // Return as Python list
       })
       .def("aggregate", & RlweSecAgg < ModularInt > ::Aggregate) // Member function
+      .def("aggregate_many", & RlweSecAgg < ModularInt > ::AggregateMany) // Member function
       .def("sum_keys", & RlweSecAgg < ModularInt > ::SumKeys) // Member function
       .def_static("sample_plaintext", [](size_t modulus, size_t num_coeffcients) {
         auto result = RlweSecAgg < ModularInt > ::SamplePlaintext(modulus, num_coeffcients);
@@ -119,7 +157,10 @@ namespace rlwe_sa {
           py_result.push_back(py::int_(Uint128ToPyInt(val)));
         }
         return py_result;
-      }); // Non-static function
+      }) // Non-static function
+      .def("convert_key_buffer", [](RlweSecAgg < ModularInt > & self, const rlwe::SymmetricRlweKey < ModularInt > & key) {
+        return KeyVectorToArray(self.ConvertKey(key));
+      });
     py::class_ < rlwe::SymmetricRlweKey < ModularInt >> (m, "SymmetricRlweKey");
     py::class_ < rlwe::SymmetricRlweCiphertext < ModularInt >> (m, "SymmetricRlweCiphertext")
       // Add this two method Len and LogModulus
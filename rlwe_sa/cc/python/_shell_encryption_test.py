@@ -2,6 +2,9 @@ import rlwe_sa.cc.python._shell_encryption as rlwe_sa
 import time
 from math import log2, ceil, floor
 
+import numpy as np
+
+
 def assert_encryption_decryption(input_size, ptxt_bits):
     rlwe_sec_agg = rlwe_sa.RlweSecAgg(input_size, ptxt_bits)
     plaintext = rlwe_sec_agg.sample_plaintext(input_size, ptxt_bits)
@@ -25,86 +28,85 @@ def assert_encryption_decryption_seed(input_size, ptxt_bits):
     assert decrypted == plaintext
 
 
-def assert_sum_key(input_size, ptxt_bits, modulus):
+def assert_sum_key(input_size, ptxt_bits):
     rlwe_sec_agg = rlwe_sa.RlweSecAgg(input_size, ptxt_bits)
     sk_1 = rlwe_sec_agg.sample_key()
     sk_2 = rlwe_sec_agg.sample_key()
-    sk_1_vector = rlwe_sec_agg.convert_key(sk_1)
-    sk_2_vector = rlwe_sec_agg.convert_key(sk_2)
-    sk_sum_vector = [(a + b) % modulus for a, b in zip(sk_1_vector, sk_2_vector)]
+    sk_1_vector = rlwe_sec_agg.convert_key_buffer(sk_1)
+    sk_2_vector = rlwe_sec_agg.convert_key_buffer(sk_2)
+    # uint64 key sums are already below the 80-bit key modulus, so no reduction is needed
+    sk_sum_vector = sk_1_vector + sk_2_vector
     sk_sum = rlwe_sec_agg.sum_keys(sk_1, sk_2)
     sk_sum_true_vector = rlwe_sec_agg.convert_key(sk_sum)
-    assert sk_sum_vector == sk_sum_true_vector
+    assert sk_sum_vector.tolist() == sk_sum_true_vector
 
 
-def assert_aggregation(input_size, ptxt_bits, modulus):
+def assert_aggregation(input_size, ptxt_bits):
     rlwe_sec_agg = rlwe_sa.RlweSecAgg(input_size, ptxt_bits)
     plaintext_1 = rlwe_sec_agg.sample_plaintext(input_size, ptxt_bits)
     sk_1 = rlwe_sec_agg.sample_key()
-    sk_1_vector = rlwe_sec_agg.convert_key(sk_1)
+    sk_1_vector = rlwe_sec_agg.convert_key_buffer(sk_1)
     sk_1 = rlwe_sec_agg.create_key(sk_1_vector)
     ciphertext_1 = rlwe_sec_agg.encrypt(sk_1, plaintext_1)
     plaintext_2 = rlwe_sec_agg.sample_plaintext(input_size, ptxt_bits)
     sk_2 = rlwe_sec_agg.sample_key()
-    sk_2_vector = rlwe_sec_agg.convert_key(sk_2)
+    sk_2_vector = rlwe_sec_agg.convert_key_buffer(sk_2)
     sk_2 = rlwe_sec_agg.create_key(sk_2_vector)
     ciphertext_2 = rlwe_sec_agg.encrypt(sk_2, plaintext_2)
-    sk_sum_vector = [(a + b) % modulus for a, b in zip(sk_1_vector, sk_2_vector)]
+    ptxt_mod = (1 << ptxt_bits) + 1
     plaintext_sum = [
-        (a + b) % ((2**ptxt_bits) + 1) for a, b in zip(plaintext_1, plaintext_2)
+        (a + b) % ptxt_mod for a, b in zip(plaintext_1, plaintext_2)
     ]
-    sk_sum = rlwe_sec_agg.create_key(sk_sum_vector)
+    sk_sum = rlwe_sec_agg.sum_keys(sk_1, sk_2)
     ciphertext_sum = rlwe_sec_agg.aggregate(ciphertext_1, ciphertext_2)
     decrypted_sum = rlwe_sec_agg.decrypt(sk_sum, ciphertext_sum)
     for i in range(input_size):
         assert decrypted_sum[i] == plaintext_sum[i], "position: " + str(i) + "value: " + str(decrypted_sum[i]) + "!=" + str(plaintext_sum[i])
 
 
-def assert_multiple_aggregation(num_clients, input_size, ptxt_bits, modulus):
+def assert_multiple_aggregation(num_clients, input_size, ptxt_bits):
     encrypt_time = []
     aggregate_time = []
     rlwe_sec_server = rlwe_sa.RlweSecAgg(input_size, ptxt_bits)
     seed = rlwe_sec_server.get_seed()
     for i in range(num_clients):
         if i == 0:
-            plaintext_sum = [0] * input_size
+            plaintext_sum = np.zeros(input_size, dtype=np.uint64)
             len_ptxt_sum = len(plaintext_sum)
             rlwe_sec_client = rlwe_sa.RlweSecAgg(len(plaintext_sum), ptxt_bits, seed)
-            sk_sum = rlwe_sec_client.sample_key()
-            ciphertext_sum = rlwe_sec_client.encrypt(sk_sum, plaintext_sum)
-            sk_vector_sum = rlwe_sec_client.convert_key(sk_sum)
-        plaintext = [1] * input_size
+            sks = rlwe_sec_client.sample_keys(num_clients + 1)
+            sk_sum = sks[0]
+            ciphertexts = [rlwe_sec_client.encrypt(sk_sum, plaintext_sum)]
+            sk_vector_sum = rlwe_sec_client.convert_key_buffer(sk_sum)
+        plaintext = np.ones(input_size, dtype=np.uint64)
         len_ptxt_sum = len(plaintext)
-        sk = rlwe_sec_client.sample_key()
+        sk = sks[i + 1]
         start_encrypt = time.time()
         chipertext = rlwe_sec_client.encrypt(sk, plaintext)
-        sk_vector = rlwe_sec_client.convert_key(sk)
+        sk_vector = rlwe_sec_client.convert_key_buffer(sk)
         end_encrypt = time.time()
         time_encrypt = end_encrypt - start_encrypt
         encrypt_time.append(time_encrypt)
-        plaintext_sum = [
-            (a + b) % ((2 ** modulus.bit_length() + 1))
-            for a, b in zip(plaintext_sum, plaintext)
-        ]
-        sk_vector_sum = [(a + b)  for a, b in zip(sk_vector_sum, sk_vector)]
-        start_aggregate = time.time()
-        ciphertext_sum = rlwe_sec_server.aggregate(ciphertext_sum, chipertext)
-        end_aggregate = time.time()
-        time_aggregate = end_aggregate - start_aggregate
-        aggregate_time.append(time_aggregate)
-    sk_vector_sum = [a % modulus for a in sk_vector_sum]
+        # Both sums stay far below 2**64, and so below the 80-bit moduli; they never need reducing
+        plaintext_sum += plaintext
+        sk_vector_sum += sk_vector
+        ciphertexts.append(chipertext)
+    start_aggregate = time.time()
+    ciphertext_sum = rlwe_sec_server.aggregate_many(ciphertexts)
+    end_aggregate = time.time()
+    time_aggregate = end_aggregate - start_aggregate
+    aggregate_time.append(time_aggregate)
     sk_sum = rlwe_sec_server.create_key(sk_vector_sum)
     decrypted_sum = rlwe_sec_server.decrypt(sk_sum, ciphertext_sum)
-    assert decrypted_sum == plaintext_sum
+    assert decrypted_sum == plaintext_sum.tolist()
 
 
 input_size = 2**17
 num_clients = 5
 ptxt_bits = 73
-modulus = 646119422561999443726337
 
 assert_encryption_decryption(input_size, ptxt_bits)
-assert_sum_key(input_size, ptxt_bits, modulus)
-assert_aggregation(input_size, ceil(ptxt_bits - log2(2)), modulus)
-assert_multiple_aggregation(num_clients, input_size, ceil(ptxt_bits - log2(num_clients)), modulus)
+assert_sum_key(input_size, ptxt_bits)
+assert_aggregation(input_size, ceil(ptxt_bits - log2(2)))
+assert_multiple_aggregation(num_clients, input_size, ceil(ptxt_bits - log2(num_clients)))
 print("All tests passed")
\ No newline at end of file
@@ -137,7 +137,7 @@ class SymmetricRlweCiphertext {
   }
 
   //Create an Add only on the first component of the ciphertext
-  rlwe::StatusOr<SymmetricRlweCiphertext> AddInPlaceFst(const SymmetricRlweCiphertext& that) {
+  absl::Status AddInPlaceFst(const SymmetricRlweCiphertext& that) {
     if (power_of_s_ != that.power_of_s_) {
       return absl::InvalidArgumentError(
           "Ciphertexts must be encrypted with the same key power.");
@@ -150,7 +150,7 @@ class SymmetricRlweCiphertext {
 
     RLWE_RETURN_IF_ERROR(c_[0].AddInPlace(that.c_[0], modulus_params_));
 
-    return *this;
+    return absl::OkStatus();
   }
   // Homomorphic subtraction: subtract the polynomials representing the
   // ciphertexts component-wise. The example below demonstrates why this
@@ -12,6 +12,7 @@
 #include <functional>
 #include <iostream>
 #include <random>
+#include <stdexcept>
 #include <vector>
 #include <assert.h>  
 
@@ -76,6 +77,12 @@ std::vector<ModularInt> ConvertToMontgomery(
   }
   return output;
 }
+rlwe::SymmetricRlweKey<ModularInt> SampleKeyFromPrng(rlwe::SecurePrng* prng) {
+    ASSERT_OK_AND_ASSIGN(auto key, rlwe::SymmetricRlweKey<ModularInt>::Sample(
+        _context_ptr_q->GetLogN(), _context_ptr_q->GetVariance(), _context_ptr_q->GetLogT(),
+        _context_ptr_q->GetModulusParams(), _context_ptr_q->GetNttParams(), prng));
+    return key;
+}
 static std::vector<std::vector<typename ModularInt::Int>> splitVector(const std::vector<typename ModularInt::Int>& input_vector, size_t n) {
     
     std::vector<std::vector<typename ModularInt::Int>> result;
@@ -132,10 +139,18 @@ public:
   
   rlwe::SymmetricRlweKey<ModularInt> SampleKey() {
     ASSERT_OK_AND_ASSIGN(auto prng, GetPrg());
-    ASSERT_OK_AND_ASSIGN(auto key, rlwe::SymmetricRlweKey<ModularInt>::Sample(
-        _context_ptr_q->GetLogN(), _context_ptr_q->GetVariance(), _context_ptr_q->GetLogT(),
-        _context_ptr_q->GetModulusParams(), _context_ptr_q->GetNttParams(), prng.get()));
-    return key;
+    return SampleKeyFromPrng(prng.get());
+  }
+
+  // Sample num_keys keys from a single PRNG, seeded once for all of them
+  std::vector<rlwe::SymmetricRlweKey<ModularInt>> SampleKeys(int num_keys) {
+    ASSERT_OK_AND_ASSIGN(auto prng, GetPrg());
+    std::vector<rlwe::SymmetricRlweKey<ModularInt>> keys;
+    keys.reserve(num_keys);
+    for (int i = 0; i < num_keys; i++) {
+      keys.push_back(SampleKeyFromPrng(prng.get()));
+    }
+    return keys;
   }
  
   rlwe::SymmetricRlweKey<ModularInt> SumKeys(rlwe::SymmetricRlweKey<ModularInt> key1, rlwe::SymmetricRlweKey<ModularInt> key2) {
@@ -190,11 +205,32 @@ public:
     
     return decrypted_chipertext;
   }
-std::vector<rlwe::SymmetricRlweCiphertext<ModularInt>> Aggregate(std::vector<rlwe::SymmetricRlweCiphertext<ModularInt>>& chipertext_sum, std::vector<rlwe::SymmetricRlweCiphertext<ModularInt>>& ciphertext) {
-    std::vector<rlwe::SymmetricRlweCiphertext<ModularInt>> result = chipertext_sum;
+// The ciphertexts are kept in the NTT domain, so aggregating them is a pointwise addition done in place on chipertext_sum.
+std::vector<rlwe::SymmetricRlweCiphertext<ModularInt>> Aggregate(std::vector<rlwe::SymmetricRlweCiphertext<ModularInt>> chipertext_sum, const std::vector<rlwe::SymmetricRlweCiphertext<ModularInt>>& ciphertext) {
+    if (ciphertext.size() != chipertext_sum.size()) {
+        throw std::invalid_argument("Aggregate needs ciphertexts with the same number of parts");
+    }
     for (int j = 0; j < chipertext_sum.size(); j++) {
-        ASSERT_OK_AND_ASSIGN(rlwe::SymmetricRlweCiphertext<ModularInt> tmp, chipertext_sum[j].AddInPlaceFst(ciphertext[j]));
-        result[j] = tmp;
+        auto status = chipertext_sum[j].AddInPlaceFst(ciphertext[j]);
+        assert(status.ok());
+    }
+    return chipertext_sum;
+}
+
+// Aggregate all the ciphertexts in a single pass, instead of one Aggregate call per ciphertext.
+std::vector<rlwe::SymmetricRlweCiphertext<ModularInt>> AggregateMany(const std::vector<std::vector<rlwe::SymmetricRlweCiphertext<ModularInt>>>& ciphertexts) {
+    if (ciphertexts.empty()) {
+        throw std::invalid_argument("AggregateMany needs at least one ciphertext");
+    }
+    std::vector<rlwe::SymmetricRlweCiphertext<ModularInt>> result = ciphertexts[0];
+    for (size_t i = 1; i < ciphertexts.size(); i++) {
+        if (ciphertexts[i].size() != result.size()) {
+            throw std::invalid_argument("AggregateMany needs ciphertexts with the same number of parts");
+        }
+        for (size_t j = 0; j < result.size(); j++) {
+            auto status = result[j].AddInPlaceFst(ciphertexts[i][j]);
+            assert(status.ok());
+        }
     }
     return result;
 }
@@ -25,6 +25,8 @@
 
 #include <random>
 
+#include <stdexcept>
+
 #include <vector>
 
 #include <gmock/gmock.h>
@@ -115,6 +117,24 @@ namespace {
     }
   }
 
+  // Ensure that every key sampled in a batch can decrypt its own ciphertexts.
+  TYPED_TEST(RlweSecAggTest, CanDecryptWithSampledKeys) {
+    int n = 5;
+    int input_size = pow(2, 11);
+    int log_t = ptxtModulus;
+    for (int i = 0; i < kTestingRounds; i++) {
+      RlweSecAgg < TypeParam > rlweSecAgg = RlweSecAgg < TypeParam > (input_size, log_t);
+      std::vector < typename TypeParam::Int > plaintext = rlweSecAgg.SamplePlaintext(input_size, log_t);
+      std::vector < rlwe::SymmetricRlweKey < TypeParam >> keys = rlweSecAgg.SampleKeys(n);
+      ASSERT_EQ(keys.size(), static_cast < size_t > (n));
+      for (auto & key: keys) {
+        std::vector < rlwe::SymmetricRlweCiphertext < TypeParam >> ciphertext = rlweSecAgg.Encrypt(key, plaintext);
+        EXPECT_EQ(plaintext, rlweSecAgg.Decrypt(key, ciphertext));
+      }
+      EXPECT_NE(keys[0].Key(), keys[1].Key());
+    }
+  }
+
   TYPED_TEST(RlweSecAggTest, CanSumKey) {
     int n = 10;
     int input_size = pow(2, 11);
@@ -168,4 +188,31 @@ namespace {
     }
 
   }
+  TYPED_TEST(RlweSecAggTest, AggregateMany) {
+    int n = 10;
+    int input_size = pow(2, 13);
+    // remove log(n) from the modulus to avoid overflow
+    int log_t = ptxtModulus - log2(n);
+    for (int i = 0; i < kTestingRounds; i++) {
+      RlweSecAgg < TypeParam > rlweSecAgg = RlweSecAgg < TypeParam > (input_size, log_t);
+      std::vector < typename TypeParam::Int > plaintext = rlweSecAgg.SamplePlaintext(input_size, log_t);
+      rlwe::SymmetricRlweKey < TypeParam > key_sum = rlweSecAgg.SampleKey();
+      std::vector < std::vector < rlwe::SymmetricRlweCiphertext < TypeParam >>> ciphertexts = {rlweSecAgg.Encrypt(key_sum, plaintext)};
+      std::vector < rlwe::SymmetricRlweCiphertext < TypeParam >> chipertext_sum = ciphertexts[0];
+      for (int i = 1; i < n; i++) {
+        rlwe::SymmetricRlweKey < TypeParam > key = rlweSecAgg.SampleKey();
+        ciphertexts.push_back(rlweSecAgg.Encrypt(key, plaintext));
+        chipertext_sum = rlweSecAgg.Aggregate(chipertext_sum, ciphertexts.back());
+        ASSERT_OK_AND_ASSIGN(key_sum, key_sum.Add(key));
+      }
+      // Aggregating all the ciphertexts at once matches the pairwise aggregation
+      std::vector < rlwe::SymmetricRlweCiphertext < TypeParam >> chipertext_many = rlweSecAgg.AggregateMany(ciphertexts);
+      EXPECT_THAT(rlweSecAgg.Decrypt(key_sum, chipertext_many), rlweSecAgg.Decrypt(key_sum, chipertext_sum));
+      // Empty and mismatched inputs are rejected instead of read out of bounds
+      EXPECT_THROW(rlweSecAgg.AggregateMany({}), std::invalid_argument);
+      ciphertexts.back().pop_back();
+      EXPECT_THROW(rlweSecAgg.AggregateMany(ciphertexts), std::invalid_argument);
+      EXPECT_THROW(rlweSecAgg.Aggregate(chipertext_sum, ciphertexts.back()), std::invalid_argument);
+    }
+  }
 } // namespace
\ No newline at end of file
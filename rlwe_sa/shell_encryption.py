@@ -14,10 +14,7 @@ def next_power_of_two(n):
         return n
 
     # Find the next power of 2
-    power = 1
-    while power < n:
-        power *= 2
-    return power
+    return 1 << (n - 1).bit_length()
 
 class RlweSA:
 
@@ -29,7 +26,9 @@ class RlweSA:
         self._seed = seed
 
     def encrypt(self, secret_key, plaintext):
-        plaintext = plaintext + [0] * (self.new_num_elements - len(plaintext))
+        num_values = len(plaintext)
+        if num_values < self.new_num_elements:
+            plaintext = plaintext + [0] * (self.new_num_elements - num_values)
         return self._rlwe_sa.encrypt(secret_key, plaintext)
 
     def get_seed(self):
@@ -37,9 +36,15 @@ class RlweSA:
     
     def gen_secret_key(self):
         return self._rlwe_sa.sample_key()
+
+    def gen_secret_keys(self, num_keys):
+        return self._rlwe_sa.sample_keys(num_keys)
     
     def key_to_vector(self, key):
         return self._rlwe_sa.convert_key(key)
+
+    def key_to_array(self, key):
+        return self._rlwe_sa.convert_key_buffer(key)
     
     def vector_to_key(self, vector):
         return self._rlwe_sa.create_key(vector)
@@ -47,8 +52,14 @@ class RlweSA:
     def decrypt(self, secret_key, ciphertext):
         return self._rlwe_sa.decrypt(secret_key, ciphertext)[:self.num_elements]
 
+    def sum_keys(self, key1, key2):
+        return self._rlwe_sa.sum_keys(key1, key2)
+
     def add(self, ciphertext1, ciphertext2):
         return self._rlwe_sa.aggregate(ciphertext1, ciphertext2)
+
+    def add_many(self, ciphertexts):
+        return self._rlwe_sa.aggregate_many(ciphertexts)
     
     @property
     def get_modulus_key(self):
@@ -1,5 +1,10 @@
 from math import ceil, floor, log2
 
+import numpy as np
+
+_LANE_BITS = 64
+_LANE_MASK = (1 << _LANE_BITS) - 1
+
 
 class VES(object):
     def __init__(self, pt_size, add_ops, value_size, vector_size) -> None:
@@ -12,48 +17,103 @@ class VES(object):
         self.compratio = floor(pt_size / self.element_size)
         self.numbatches = ceil(self.vector_size / self.compratio)
         self.encoded_size = None
+        self._mask = (1 << self.element_size) - 1
+        # Narrowest unsigned dtype holding a slot, e.g. uint16 for 16-bit slots.
+        self._slot_dtype = np.min_scalar_type(self._mask)
+        self._expected_per_batch = self.compratio
+        # Number of uint64 lanes a packed batch spans; batches fitting in one
+        # or two lanes are packed and unpacked with NumPy.
+        self._num_lanes = ceil(self.element_size * self.compratio / _LANE_BITS)
+        self._use_lanes = self.element_size <= _LANE_BITS and self._num_lanes <= 2
 
     def encode(self, vs):
-        bs = self.compratio
-        e = []
-        es = []
-        for v in vs:
-            e.append(v)
-            bs -= 1
-            if bs == 0:
-                es.append(self._batch(e))
-                e = []
-                bs = self.compratio
-        if e:
-            es.append(self._batch(e))
+        if self._use_lanes:
+            es = self._encode_lanes(vs)
+        else:
+            if isinstance(vs, np.ndarray):
+                vs = vs.tolist()
+            compratio = self.compratio
+            batch = self._batch
+            bs = compratio
+            e = []
+            es = []
+            for v in vs:
+                e.append(v)
+                bs -= 1
+                if bs == 0:
+                    es.append(batch(e))
+                    e = []
+                    bs = compratio
+            if e:
+                es.append(batch(e))
         self.encoded_size = len(es)
         return es
 
     def decode(self, es):
+        if self._use_lanes:
+            return self._decode_lanes(es)
+        per_batch = self._expected_per_batch
+        debatch = self._debatch
         vs = []
+        remaining = self.vector_size
         for e in es:
-            for v in self._debatch(e):
-                vs.append(v)
+            if remaining <= 0:
+                break
+            n = min(per_batch, remaining)
+            vs.extend(debatch(e, n))
+            remaining -= n
         return vs
 
+    def _encode_lanes(self, vs):
+        # NumPy inputs keep their own dtype until they are widened into the
+        # uint64 slot buffer below.
+        if not isinstance(vs, np.ndarray):
+            vs = np.asarray(vs, dtype=np.uint64)
+        numbatches = ceil(len(vs) / self.compratio)
+        slots = np.zeros(numbatches * self.compratio, dtype=np.uint64)
+        slots[:len(vs)] = vs
+        slots = slots.reshape(numbatches, self.compratio)
+        lo = np.zeros(numbatches, dtype=np.uint64)
+        hi = np.zeros(numbatches, dtype=np.uint64)
+        for i in range(self.compratio):
+            shift = i * self.element_size
+            if shift < _LANE_BITS:
+                lo |= slots[:, i] << np.uint64(shift)
+                if shift + self.element_size > _LANE_BITS:
+                    hi |= slots[:, i] >> np.uint64(_LANE_BITS - shift)
+            else:
+                hi |= slots[:, i] << np.uint64(shift - _LANE_BITS)
+        if self._num_lanes == 1:
+            return lo.tolist()
+        return [(h << _LANE_BITS) | l for h, l in zip(hi.tolist(), lo.tolist())]
+
+    def _decode_lanes(self, es):
+        es = es[:self.numbatches]
+        lo = np.array([e & _LANE_MASK for e in es], dtype=np.uint64)
+        mask = np.uint64(self._mask)
+        hi = np.array([(e >> _LANE_BITS) & _LANE_MASK for e in es], dtype=np.uint64)
+        slots = np.empty((len(es), self.compratio), dtype=self._slot_dtype)
+        for i in range(self.compratio):
+            shift = i * self.element_size
+            if shift < _LANE_BITS:
+                slot = lo >> np.uint64(shift)
+                if shift + self.element_size > _LANE_BITS:
+                    slot |= hi << np.uint64(_LANE_BITS - shift)
+            else:
+                slot = hi >> np.uint64(shift - _LANE_BITS)
+            slots[:, i] = slot & mask
+        return slots.ravel()[:self.vector_size].tolist()
+
     def _batch(self, vs):
-        i = 0
+        es = self.element_size
         a = 0
+        shift = 0
         for v in vs:
-            a |= v << self.element_size * i
-            i += 1
+            a |= v << shift
+            shift += es
         return a
 
-    def _debatch(self, b):
-        vs = []
-        bit = 0b1
-        mask = 0b1
-        for _ in range(self.element_size - 1):
-            mask <<= 1
-            mask |= bit
-
-        while b != 0:
-            v = mask & b
-            vs.append(int(v))
-            b >>= self.element_size
-        return vs
+    def _debatch(self, b, n):
+        m = self._mask
+        es = self.element_size
+        return [(b >> shift) & m for shift in range(0, n * es, es)]
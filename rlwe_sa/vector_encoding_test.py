@@ -0,0 +1,48 @@
+import random
+
+import numpy as np
+
+from rlwe_sa.vector_encoding import VES
+
+
+def reference_encode(ves, vs):
+    es = []
+    for start in range(0, len(vs), ves.compratio):
+        batch = 0
+        for i, v in enumerate(vs[start:start + ves.compratio]):
+            batch |= v << (ves.element_size * i)
+        es.append(batch)
+    return es
+
+
+def branch(ves):
+    if ves._use_lanes:
+        return "lanes" + str(ves._num_lanes)
+    return "python"
+
+
+def assert_encode_decode(pt_size, add_ops, value_size, vector_size, expected_branch):
+    ves = VES(pt_size, add_ops, value_size, vector_size)
+    assert branch(ves) == expected_branch, branch(ves)
+    # A short last batch ending in zero-valued slots
+    assert vector_size % ves.compratio != 0
+    rng = random.Random(vector_size)
+    vs = [rng.randrange(1 << value_size) for _ in range(vector_size - 3)] + [0, 0, 0]
+    es = ves.encode(vs)
+    assert es == reference_encode(ves, vs)
+    assert ves.encoded_size == ves.numbatches
+    if value_size <= 64:
+        assert ves.encode(np.array(vs, dtype=np.uint64)) == es
+    assert ves.decode(es) == vs
+    # Padding batches past vector_size are ignored
+    assert ves.decode(es + [0] * 4) == vs
+
+
+assert_encode_decode(73, 1, 16, 1001, "lanes1")
+assert_encode_decode(64, 10, 8, 1001, "lanes1")
+assert_encode_decode(73, 10, 8, 1001, "lanes2")
+assert_encode_decode(73, 1, 32, 1001, "lanes1")
+assert_encode_decode(64, 2, 20, 1001, "lanes1")
+assert_encode_decode(200, 2, 20, 1001, "python")
+assert_encode_decode(150, 4, 70, 1001, "python")
+print("All tests passed")
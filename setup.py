@@ -33,6 +33,7 @@ __version__ = '1.1.0'
 PROJECT_NAME = 'rlwe_sa'
 
 REQUIRED_PACKAGES = [
+    'numpy',
     'setuptools!=50.0.0',  # https://github.com/pypa/setuptools/issues/2350
 ]
 